@@ -8,104 +8,295 @@ Provides better observability and control over what gets deleted
 import sys
 import argparse
 import asyncio
+import functools
 import json
+import re
+import socket
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse
 from langgraph_sdk import get_client
 
+# NumPy is optional; when present, time filters run as vectorized scans
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson ships as a dependency of langgraph-sdk (the SDK decodes every
+# search response with it), so it is always importable here; its C
+# serializer is much faster than stdlib json for metadata dumps
+try:
+    import orjson
+
+    def _dump_json(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dump_json(obj) -> str:
+        return json.dumps(obj)
+
+# Run-count bucket labels, indexed by min(run_count, 20)
+RUNS_BUCKET = (['0 runs', '1 run']
+               + [f'{i} runs' for i in range(2, 5)]
+               + ['5-9 runs'] * 5
+               + ['10-19 runs'] * 10
+               + ['20+ runs'])
+
+# The distinct bucket labels in ascending runs order, for menu display
+RUNS_BUCKET_ORDER = list(dict.fromkeys(RUNS_BUCKET))
+
+# Transient network failures worth retrying; httpx ships with the SDK
+try:
+    import httpx
+    _RETRYABLE_ERRORS = (httpx.TransportError,)
+except ImportError:
+    _RETRYABLE_ERRORS = ()
+
+# http(s) scheme plus a host, with optional port and path
+_URL_RE = re.compile(r'^https?://[^/\s]+(?::\d+)?(?:/.*)?$')
+
+STATUS_ICONS = {
+    'idle': '😴',
+    'running': '🏃',
+    'completed': '✅',
+    'failed': '❌',
+    'pending': '⏳'
+}
+
+
+@dataclass
+class ThreadTable:
+    """Columnar (SoA) view of the discovered threads, built once per session.
+
+    The column arrays are parallel to `threads`; filters and grouping scan
+    them instead of re-walking the thread dicts. Columns stay None when
+    NumPy isn't installed and callers fall back to dict scans.
+    """
+    threads: List[Dict]
+    timestamps: Optional[Any] = None
+    statuses: Optional[Any] = None
+    graph_ids: Optional[Any] = None
+    run_buckets: Optional[Any] = None
+
+    @classmethod
+    def build(cls, threads: List[Dict]) -> 'ThreadTable':
+        if np is None:
+            return cls(threads)
+        return cls(
+            threads,
+            timestamps=np.array(
+                [thread['_ts'] if thread.get('_ts') is not None else np.nan for thread in threads],
+                dtype=np.float64
+            ),
+            statuses=np.array([thread.get('status', 'unknown') for thread in threads]),
+            graph_ids=np.array([(thread.get('metadata') or {}).get('graph_id') or '' for thread in threads]),
+            run_buckets=np.array([RUNS_BUCKET[min(thread.get('_run_count', 0), 20)] for thread in threads])
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_dt(created_at: str) -> datetime:
+    """Parse an ISO timestamp string, cached so each unique string is parsed once"""
+    return datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_ts(created_at: str) -> float:
+    """Parse an ISO timestamp string to epoch seconds, cached"""
+    return _parse_dt(created_at).timestamp()
+
 
 class ThreadCleanup:
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
-        self.base_url = base_url
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 status: Optional[str] = None, graph_id: Optional[str] = None,
+                 concurrency: int = 8):
+        # Normalize once so every request URL the SDK derives is canonical
+        self.base_url = base_url.rstrip('/')
         self.api_key = api_key
-        self.client = get_client(url=base_url, api_key=api_key)
+        # Optional server-side filters; threads outside them are never
+        # downloaded, so discovery and categorization only touch candidates
+        self.status = status
+        self.graph_id = graph_id
+        # How many search pages to keep in flight during discovery
+        self.concurrency = max(1, concurrency)
+        self.client = get_client(url=self.base_url, api_key=api_key)
+
+        # The SDK keeps one pooled httpx.AsyncClient that the search,
+        # run-count and delete phases all share. Swap in a tuned transport:
+        # TCP_NODELAY so the many small request bodies aren't held back by
+        # Nagle/delayed-ACK interaction, and HTTP/2 (when h2 is installed)
+        # so the concurrent delete storm multiplexes over a few connections.
+        try:
+            import httpx
+
+            transport_kwargs = {
+                'limits': httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                'socket_options': [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+            }
+            try:
+                import h2  # noqa: F401
+                transport_kwargs['http2'] = True
+            except ImportError:
+                pass
+
+            self.client.http.client._transport = httpx.AsyncHTTPTransport(**transport_kwargs)
+        except Exception:
+            pass
+
+        self._table = None
+        self._cats_cache = None
+        self._summary_cache = {}
+        # Session-wide categories; valid until threads are actually deleted
+        self.categories = None
 
     def ask_question(self, question: str) -> str:
         """Ask user for input"""
         return input(question)
 
-    async def categorize_threads(self, threads: List[Dict]) -> Dict:
-        """Categorize threads by status, runs, and graph ID"""
-        categories = {
-            'byGraph': {},
-            'byStatus': {},
-            'byRuns': {}
-        }
+    async def aclose(self) -> None:
+        """Close the SDK's underlying HTTP client and its pooled connections"""
+        http_client = getattr(getattr(self.client, 'http', None), 'client', None)
+        if http_client is not None:
+            try:
+                await http_client.aclose()
+            except Exception:
+                pass
 
-        print('\n🔍 Fetching run counts...')
-        # Fetch run counts for all threads
+    async def _annotate_run_counts(self, threads: List[Dict], verbose: bool = False) -> None:
+        """Fetch and attach _run_count to threads that don't have one yet"""
+        total = len(threads)
         for i, thread in enumerate(threads):
-            thread_id = thread.get('thread_id')
-            
+            if '_run_count' in thread:
+                continue
+
             # Get run count from API
             try:
-                runs = await self.client.runs.list(thread_id)
+                runs = await self.client.runs.list(thread.get('thread_id'))
                 run_count = len(runs) if runs else 0
             except:
                 run_count = 0
-            
+
             # Store run count in thread for later display
             thread['_run_count'] = run_count
-            
-            print(f'Analyzing thread {i+1}/{len(threads)}...', end='\r')
-            
-            status = thread.get('status', 'unknown')
-
-            # Graph categorization
-            if thread.get('metadata') and thread['metadata'].get('graph_id'):
-                graph_id = thread['metadata']['graph_id']
-                if graph_id not in categories['byGraph']:
-                    categories['byGraph'][graph_id] = []
-                categories['byGraph'][graph_id].append(thread)
-
-            # Status categorization
-            if status not in categories['byStatus']:
-                categories['byStatus'][status] = []
-            categories['byStatus'][status].append(thread)
-
-            # Runs categorization
-            if run_count == 0:
-                runs_category = '0 runs'
-            elif run_count == 1:
-                runs_category = '1 run'
-            elif run_count < 5:
-                runs_category = f'{run_count} runs'
-            elif run_count < 10:
-                runs_category = '5-9 runs'
-            elif run_count < 20:
-                runs_category = '10-19 runs'
-            else:
-                runs_category = '20+ runs'
 
-            if runs_category not in categories['byRuns']:
-                categories['byRuns'][runs_category] = []
-            categories['byRuns'][runs_category].append(thread)
+            if verbose:
+                print(f'Analyzing thread {i+1}/{total}...', end='\r')
 
+    async def categorize_threads(self, threads: List[Dict]) -> Dict:
+        """Categorize threads by status, runs, and graph ID"""
+        print('\n🔍 Fetching run counts...')
+        # Usually a no-op: run counts are fetched while pages stream in
+        await self._annotate_run_counts(threads, verbose=True)
         print(' ' * 50, end='\r')  # Clear the progress line
-        # Add allThreads for easy access
-        categories['allThreads'] = threads
-        return categories
+        return self._build_categories(threads)
+
+    async def _cats(self, threads: List[Dict]) -> Dict:
+        """Cached categorization; recomputed only for a new thread list"""
+        if self._cats_cache is None or self._cats_cache[0] is not threads:
+            self._cats_cache = (threads, await self.categorize_threads(threads))
+        return self._cats_cache[1]
+
+    def _merge_page_categories(self, page: List[Dict], acc: Dict, lock: threading.Lock) -> None:
+        """Fold one fetched page into the shared category accumulators.
+
+        Pure CPU work, run via asyncio.to_thread so bucketing finished
+        pages overlaps the page fetches still in flight.
+        """
+        for thread in page:
+            created_at = thread.get('created_at')
+            try:
+                thread['_ts'] = _parse_ts(created_at) if created_at else None
+            except:
+                thread['_ts'] = None
+
+        with lock:
+            for thread in page:
+                metadata = thread.get('metadata') or {}
+                graph_id = metadata.get('graph_id')
+                if graph_id:
+                    acc['byGraph'][graph_id].append(thread)
+
+                acc['byStatus'][thread.get('status', 'unknown')].append(thread)
+                acc['byRuns'][RUNS_BUCKET[min(thread.get('_run_count', 0), 20)]].append(thread)
+
+    def _build_categories(self, threads: List[Dict]) -> Dict:
+        """Group threads into status/runs/graph buckets"""
+        if np is not None and threads:
+            # Columnar pass over the session table: group each attribute
+            # with a single sort (no per-bucket rescan of the array)
+            table = self._table
+            if table is None or table.threads is not threads:
+                table = ThreadTable.build(threads)
+
+            def group_by(values) -> Dict:
+                uniques, inverse = np.unique(values, return_inverse=True)
+                order = np.argsort(inverse, kind='stable')
+                bounds = np.searchsorted(inverse[order], np.arange(len(uniques) + 1))
+                return {str(uniques[k]): [threads[i] for i in order[bounds[k]:bounds[k + 1]]]
+                        for k in range(len(uniques))}
+
+            by_status = group_by(table.statuses)
+            by_graph = group_by(table.graph_ids)
+            by_graph.pop('', None)  # threads without a graph_id
+            by_runs = group_by(table.run_buckets)
+        else:
+            by_graph = defaultdict(list)
+            by_status = defaultdict(list)
+            by_runs = defaultdict(list)
+
+            for thread in threads:
+                metadata = thread.get('metadata') or {}
+                graph_id = metadata.get('graph_id')
+                if graph_id:
+                    by_graph[graph_id].append(thread)
+
+                by_status[thread.get('status', 'unknown')].append(thread)
+                by_runs[RUNS_BUCKET[min(thread.get('_run_count', 0), 20)]].append(thread)
+
+            by_graph = dict(by_graph)
+            by_status = dict(by_status)
+            by_runs = dict(by_runs)
+
+        # Keep runs buckets in ascending order so menus can iterate as-is
+        by_runs = {label: by_runs[label] for label in RUNS_BUCKET_ORDER if label in by_runs}
+
+        # Plain dicts downstream so menu code can't grow buckets by accident
+        return {
+            'byGraph': by_graph,
+            'byStatus': by_status,
+            'byRuns': by_runs,
+            'allThreads': threads
+        }
 
     def display_thread_summary(self, thread: Dict) -> str:
-        """Display summary of a single thread"""
+        """Display summary of a single thread (formatted once per thread)"""
+        thread_id = thread.get('thread_id', 'Unknown')
+        cached = self._summary_cache.get(thread_id)
+        if cached is not None:
+            return cached
+
         created_at = thread.get('created_at', 'Unknown')
         if created_at != 'Unknown':
             try:
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                created_at = dt.isoformat()
+                created_at = _parse_dt(created_at).isoformat()
             except:
                 pass
 
         status = thread.get('status', 'unknown')
         run_count = thread.get('_run_count', 0)
-        metadata = json.dumps(thread.get('metadata', {})) if thread.get('metadata') else 'None'
+        metadata = _dump_json(thread.get('metadata', {})) if thread.get('metadata') else 'None'
 
-        return f"""  ID: {thread.get('thread_id', 'Unknown')}
+        summary = f"""  ID: {thread_id}
   Created: {created_at}
   Status: {status}
   Runs: {run_count}
   Metadata: {metadata}"""
+        self._summary_cache[thread_id] = summary
+        return summary
 
     def display_categories(self, categories: Dict) -> None:
         """Display thread categories"""
@@ -114,14 +305,7 @@ class ThreadCleanup:
         if categories['byStatus']:
             print('\n📝 By Status:')
             for status, threads in categories['byStatus'].items():
-                status_icons = {
-                    'idle': '😴',
-                    'running': '🏃',
-                    'completed': '✅',
-                    'failed': '❌',
-                    'pending': '⏳'
-                }
-                icon = status_icons.get(status, '❓')
+                icon = STATUS_ICONS.get(status, '❓')
                 print(f'├─ {icon} {status}: {len(threads)}')
 
         if categories['byRuns']:
@@ -142,39 +326,73 @@ class ThreadCleanup:
             for graph_id, threads in categories['byGraph'].items():
                 print(f'├─ 📊 {graph_id}: {len(threads)}')
 
-    async def select_threads_to_delete(self, categories: Dict, all_threads: List[Dict]) -> Optional[List[Dict]]:
+    def _timestamps_for(self, all_threads: List[Dict]):
+        """The table's timestamp column, if it matches this thread list"""
+        table = self._table
+        if table is not None and table.threads is all_threads:
+            return table.timestamps
+        return None
+
+    def _filter_by_time(self, all_threads: List[Dict], start_time: float, end_time: float) -> List[Dict]:
+        """Select threads created within [start_time, end_time]"""
+        timestamps = self._timestamps_for(all_threads)
+        if timestamps is not None:
+            mask = (timestamps >= start_time) & (timestamps <= end_time)
+            return [all_threads[i] for i in np.nonzero(mask)[0]]
+        return [
+            thread for thread in all_threads
+            if thread.get('_ts') is not None and start_time <= thread['_ts'] <= end_time
+        ]
+
+    def _filter_before(self, all_threads: List[Dict], cutoff_time: float) -> List[Dict]:
+        """Select threads created strictly before cutoff_time"""
+        timestamps = self._timestamps_for(all_threads)
+        if timestamps is not None:
+            return [all_threads[i] for i in np.nonzero(timestamps < cutoff_time)[0]]
+        return [
+            thread for thread in all_threads
+            if thread.get('_ts') is not None and thread['_ts'] < cutoff_time
+        ]
+
+    def select_threads_to_delete(self, categories: Dict, all_threads: List[Dict]) -> Optional[List[Dict]]:
         """Main menu for selecting what to delete"""
-        print('\n🎯 What would you like to delete?')
-        print('1. ⏰ Delete by TIME')
-        print('2. 📝 Delete by STATUS')
-        print('3. 🏃 Delete by RUNS COUNT')
-        print('4. 🔧 Delete by GRAPH ID')
-        print('5. 👁️  PREVIEW all threads')
-        print('6. ⚠️  Delete ALL threads - DANGEROUS!')
-        print('7. 🚪 Exit without deleting')
-
-        choice = self.ask_question('\nSelect option (1-7): ')
-
-        if choice == '1':
-            return await self.select_by_time(all_threads, categories)
-        elif choice == '2':
-            return await self.select_by_status(categories['byStatus'], all_threads, categories)
-        elif choice == '3':
-            return await self.select_by_runs(categories['byRuns'], all_threads, categories)
-        elif choice == '4':
-            return await self.select_by_graph(categories['byGraph'], all_threads, categories)
-        elif choice == '5':
-            return await self.preview_all_threads(all_threads, categories)
-        elif choice == '6':
-            return await self.confirm_delete_all(all_threads, categories)
-        elif choice == '7':
-            print('Exiting without deleting anything.')
-            return None
-        else:
-            print('Invalid choice. Exiting.')
-            return None
+        # Submenus return a selection, or None to come back here; looping
+        # keeps navigation depth flat no matter how often the user backs out
+        while True:
+            print('\n🎯 What would you like to delete?')
+            print('1. ⏰ Delete by TIME')
+            print('2. 📝 Delete by STATUS')
+            print('3. 🏃 Delete by RUNS COUNT')
+            print('4. 🔧 Delete by GRAPH ID')
+            print('5. 👁️  PREVIEW all threads')
+            print('6. ⚠️  Delete ALL threads - DANGEROUS!')
+            print('7. 🚪 Exit without deleting')
+
+            choice = self.ask_question('\nSelect option (1-7): ')
 
-    async def preview_all_threads(self, all_threads: List[Dict], categories: Dict) -> List[Dict]:
+            if choice == '1':
+                selection = self.select_by_time(all_threads)
+            elif choice == '2':
+                selection = self.select_by_status(categories['byStatus'])
+            elif choice == '3':
+                selection = self.select_by_runs(categories['byRuns'])
+            elif choice == '4':
+                selection = self.select_by_graph(categories['byGraph'])
+            elif choice == '5':
+                selection = self.preview_all_threads(all_threads)
+            elif choice == '6':
+                selection = self.confirm_delete_all(all_threads)
+            elif choice == '7':
+                print('Exiting without deleting anything.')
+                return None
+            else:
+                print('Invalid choice. Please select 1-7.')
+                continue
+
+            if selection is not None:
+                return selection
+
+    def preview_all_threads(self, all_threads: List[Dict]) -> Optional[List[Dict]]:
         """Preview all threads without filtering"""
         print(f'\n👁️  Previewing all {len(all_threads)} threads:')
 
@@ -182,20 +400,21 @@ class ThreadCleanup:
             print('No threads found.')
             print('1. 🚪 Go back to main menu')
             self.ask_question('\nSelect option (1): ')
-            return await self.select_threads_to_delete(categories, all_threads)
+            return None
 
         threads_per_page = 5
         start_index = 0
 
         while start_index < len(all_threads):
             end_index = min(start_index + threads_per_page, len(all_threads))
-            page_threads = all_threads[start_index:end_index]
-
-            print(f'\n--- All Threads {start_index + 1}-{end_index} of {len(all_threads)} ---')
 
-            for i, thread in enumerate(page_threads):
-                print(f'\n[{start_index + i + 1}]')
-                print(self.display_thread_summary(thread))
+            # Buffer the page and emit it with one write instead of a
+            # print (and stdout flush) per line
+            out = [f'\n--- All Threads {start_index + 1}-{end_index} of {len(all_threads)} ---']
+            for i in range(start_index, end_index):
+                out.append(f'\n[{i + 1}]')
+                out.append(self.display_thread_summary(all_threads[i]))
+            sys.stdout.write('\n'.join(out) + '\n')
 
             if end_index < len(all_threads):
                 print('\n1. Continue to next page')
@@ -203,172 +422,152 @@ class ThreadCleanup:
 
                 choice = self.ask_question('\nSelect option (1-2): ')
 
-                if choice == '1':
-                    start_index = end_index
-                    continue
-                elif choice == '2':
-                    return await self.select_threads_to_delete(categories, all_threads)
-                else:
-                    start_index = end_index
-                    continue
+                if choice == '2':
+                    return None
+                start_index = end_index
             else:
                 print('\n--- End of all threads ---')
                 print('1. 🚪 Go back to main menu')
                 self.ask_question('\nSelect option (1): ')
-                return await self.select_threads_to_delete(categories, all_threads)
+                return None
 
-        return []
+        return None
 
-    async def select_by_time(self, all_threads: List[Dict], categories: Dict) -> Optional[List[Dict]]:
+    def select_by_time(self, all_threads: List[Dict]) -> Optional[List[Dict]]:
         """Select threads by time"""
-        print('\n⏰ Delete threads created:')
-        print('1. Within the last hour')
-        print('2. Within the last week')
-        print('3. Within the last month')
-        print('4. All time (any date)')
-        print('5. Custom date range')
-        print('6. 🚪 Go back to main menu')
+        while True:
+            print('\n⏰ Delete threads created:')
+            print('1. Within the last hour')
+            print('2. Within the last week')
+            print('3. Within the last month')
+            print('4. All time (any date)')
+            print('5. Custom date range')
+            print('6. 🚪 Go back to main menu')
 
-        choice = self.ask_question('\nSelect time option (1-6): ')
+            choice = self.ask_question('\nSelect time option (1-6): ')
 
-        now = datetime.now(timezone.utc)
+            now = datetime.now(timezone.utc)
+
+            if choice == '1':
+                start_time = now.timestamp() - (60 * 60)  # 1 hour ago
+            elif choice == '2':
+                start_time = now.timestamp() - (7 * 24 * 60 * 60)  # 1 week ago
+            elif choice == '3':
+                start_time = now.timestamp() - (30 * 24 * 60 * 60)  # 1 month ago
+            elif choice == '4':
+                start_time = 0  # All time
+            elif choice == '5':
+                selection = self.select_custom_date_range(all_threads)
+                if selection is not None:
+                    return selection
+                continue
+            elif choice == '6':
+                return None
+            else:
+                print('Invalid choice. Going back.')
+                continue
 
-        if choice == '1':
-            start_time = now.timestamp() - (60 * 60)  # 1 hour ago
-            end_time = now.timestamp()
-        elif choice == '2':
-            start_time = now.timestamp() - (7 * 24 * 60 * 60)  # 1 week ago
-            end_time = now.timestamp()
-        elif choice == '3':
-            start_time = now.timestamp() - (30 * 24 * 60 * 60)  # 1 month ago
-            end_time = now.timestamp()
-        elif choice == '4':
-            start_time = 0  # All time
             end_time = now.timestamp()
-        elif choice == '5':
-            return await self.select_custom_date_range(all_threads, categories)
-        elif choice == '6':
-            return await self.select_threads_to_delete(categories, all_threads)
-        else:
-            print('Invalid choice. Going back.')
-            return await self.select_by_time(all_threads, categories)
 
-        # Filter threads by time range
-        threads_to_delete = []
-        for thread in all_threads:
-            created_at = thread.get('created_at')
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    thread_time = dt.timestamp()
-                    if start_time <= thread_time <= end_time:
-                        threads_to_delete.append(thread)
-                except:
-                    continue
+            # Filter threads by time range
+            threads_to_delete = self._filter_by_time(all_threads, start_time, end_time)
 
-        time_range_desc = {
-            '1': 'within the last hour',
-            '2': 'within the last week',
-            '3': 'within the last month',
-            '4': 'from all time'
-        }.get(choice, 'from selected time range')
-
-        print(f'\nFound {len(threads_to_delete)} threads created {time_range_desc}.')
-
-        if len(threads_to_delete) == 0:
-            print('No threads match your time criteria.')
-            return await self.select_by_time(all_threads, categories)
-
-        # Ask if they want to review before deleting
-        print('\nDo you want to:')
-        print('1. 👁️  Review threads before deleting')
-        print('2. Delete immediately')
-        print('3. 🚪 Go back to main menu')
-
-        review_choice = self.ask_question('\nSelect option (1-3): ')
-
-        if review_choice == '1':
-            return await self.review_threads(threads_to_delete, time_range_desc, all_threads, categories)
-        elif review_choice == '2':
-            return threads_to_delete
-        elif review_choice == '3':
-            return await self.select_by_time(all_threads, categories)
-        else:
-            return threads_to_delete
+            time_range_desc = {
+                '1': 'within the last hour',
+                '2': 'within the last week',
+                '3': 'within the last month',
+                '4': 'from all time'
+            }.get(choice, 'from selected time range')
 
-    async def select_custom_date_range(self, all_threads: List[Dict], categories: Dict) -> Optional[List[Dict]]:
-        """Select threads by custom cutoff date"""
-        print('\n📅 Delete threads created before a specific date:')
-        print('Enter date in format: YYYY-MM-DD HH:MM (24-hour format)')
-        print('Or just YYYY-MM-DD for whole day')
-        print('Example: 2024-01-15 14:30 or 2024-01-15')
-        print('All threads created BEFORE this date will be deleted.\n')
+            print(f'\nFound {len(threads_to_delete)} threads created {time_range_desc}.')
 
-        cutoff_date = self.ask_question('Delete threads created before: ')
+            if len(threads_to_delete) == 0:
+                print('No threads match your time criteria.')
+                continue
 
-        try:
-            if ' ' in cutoff_date:
-                cutoff_time = datetime.fromisoformat(cutoff_date).timestamp()
+            # Ask if they want to review before deleting
+            print('\nDo you want to:')
+            print('1. 👁️  Review threads before deleting')
+            print('2. Delete immediately')
+            print('3. 🚪 Go back to main menu')
+
+            review_choice = self.ask_question('\nSelect option (1-3): ')
+
+            if review_choice == '1':
+                selection = self.review_threads(threads_to_delete, time_range_desc)
+                if selection is not None:
+                    return selection
+                continue
+            elif review_choice == '3':
+                return None
             else:
-                cutoff_time = datetime.fromisoformat(cutoff_date + ' 00:00:00').timestamp()
+                return threads_to_delete
+
+    def select_custom_date_range(self, all_threads: List[Dict]) -> Optional[List[Dict]]:
+        """Select threads by custom cutoff date"""
+        while True:
+            print('\n📅 Delete threads created before a specific date:')
+            print('Enter date in format: YYYY-MM-DD HH:MM (24-hour format)')
+            print('Or just YYYY-MM-DD for whole day')
+            print('Example: 2024-01-15 14:30 or 2024-01-15')
+            print('All threads created BEFORE this date will be deleted.\n')
 
-            if cutoff_time > datetime.now().timestamp():
-                print('❌ Cutoff date cannot be in the future.')
-                return await self.select_custom_date_range(all_threads, categories)
+            cutoff_date = self.ask_question('Delete threads created before: ')
 
-        except ValueError:
-            print('❌ Invalid date format. Please use YYYY-MM-DD or YYYY-MM-DD HH:MM')
-            return await self.select_custom_date_range(all_threads, categories)
+            try:
+                if ' ' in cutoff_date:
+                    cutoff_time = datetime.fromisoformat(cutoff_date).timestamp()
+                else:
+                    cutoff_time = datetime.fromisoformat(cutoff_date + ' 00:00:00').timestamp()
 
-        # Filter threads created before the cutoff date
-        threads_to_delete = []
-        for thread in all_threads:
-            created_at = thread.get('created_at')
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    if dt.timestamp() < cutoff_time:
-                        threads_to_delete.append(thread)
-                except:
+                if cutoff_time > datetime.now().timestamp():
+                    print('❌ Cutoff date cannot be in the future.')
                     continue
 
-        cutoff_str = datetime.fromtimestamp(cutoff_time).strftime('%m/%d/%Y, %I:%M:%S %p')
-        print(f'\nFound {len(threads_to_delete)} threads created before {cutoff_str}.')
+            except ValueError:
+                print('❌ Invalid date format. Please use YYYY-MM-DD or YYYY-MM-DD HH:MM')
+                continue
 
-        if len(threads_to_delete) == 0:
-            print('No threads were created before this date.')
-            print('1. Try different date')
-            print('2. 🚪 Go back to time menu')
+            # Filter threads created before the cutoff date
+            threads_to_delete = self._filter_before(all_threads, cutoff_time)
 
-            choice = self.ask_question('\nSelect option (1-2): ')
+            cutoff_str = datetime.fromtimestamp(cutoff_time).strftime('%m/%d/%Y, %I:%M:%S %p')
+            print(f'\nFound {len(threads_to_delete)} threads created before {cutoff_str}.')
 
-            if choice == '1':
-                return await self.select_custom_date_range(all_threads, categories)
+            if len(threads_to_delete) == 0:
+                print('No threads were created before this date.')
+                print('1. Try different date')
+                print('2. 🚪 Go back to time menu')
+
+                choice = self.ask_question('\nSelect option (1-2): ')
+
+                if choice == '1':
+                    continue
+                return None
+
+            # Ask if they want to review before deleting
+            print('\nDo you want to:')
+            print('1. 👁️  Review threads before deleting')
+            print('2. Delete immediately')
+            print('3. Try different date')
+            print('4. 🚪 Go back to time menu')
+
+            review_choice = self.ask_question('\nSelect option (1-4): ')
+
+            if review_choice == '1':
+                selection = self.review_threads(threads_to_delete, f'created before {cutoff_str}')
+                if selection is not None:
+                    return selection
+                continue
+            elif review_choice == '3':
+                continue
+            elif review_choice == '4':
+                return None
             else:
-                return await self.select_by_time(all_threads, categories)
-
-        # Ask if they want to review before deleting
-        print('\nDo you want to:')
-        print('1. 👁️  Review threads before deleting')
-        print('2. Delete immediately')
-        print('3. Try different date')
-        print('4. 🚪 Go back to time menu')
-
-        review_choice = self.ask_question('\nSelect option (1-4): ')
-
-        if review_choice == '1':
-            return await self.review_threads(threads_to_delete, f'created before {cutoff_str}', all_threads, categories)
-        elif review_choice == '2':
-            return threads_to_delete
-        elif review_choice == '3':
-            return await self.select_custom_date_range(all_threads, categories)
-        elif review_choice == '4':
-            return await self.select_by_time(all_threads, categories)
-        else:
-            return threads_to_delete
+                return threads_to_delete
 
-    async def review_threads(self, threads: List[Dict], description: str = '', all_threads: Optional[List[Dict]] = None, categories: Optional[Dict] = None) -> List[Dict]:
-        """Review threads before deletion"""
+    def review_threads(self, threads: List[Dict], description: str = '') -> Optional[List[Dict]]:
+        """Review threads before deletion; returns None when cancelled"""
         description_text = f' {description}' if description else ''
         print(f'\n👁️  Reviewing {len(threads)} threads{description_text}:')
 
@@ -377,52 +576,41 @@ class ThreadCleanup:
 
         while start_index < len(threads):
             end_index = min(start_index + threads_per_page, len(threads))
-            page_threads = threads[start_index:end_index]
 
-            print(f'\n--- Threads {start_index + 1}-{end_index} of {len(threads)} ---')
-
-            for i, thread in enumerate(page_threads):
-                print(f'\n[{start_index + i + 1}]')
-                print(self.display_thread_summary(thread))
+            # Buffer the page and emit it with one write instead of a
+            # print (and stdout flush) per line
+            out = [f'\n--- Threads {start_index + 1}-{end_index} of {len(threads)} ---']
+            for i in range(start_index, end_index):
+                out.append(f'\n[{i + 1}]')
+                out.append(self.display_thread_summary(threads[i]))
+            sys.stdout.write('\n'.join(out) + '\n')
 
             if end_index < len(threads):
                 print('\n1. Continue to next page')
                 print('2. Delete all these threads')
-                print('3. 🚪 Cancel and return to main menu')
+                print('3. 🚪 Cancel and go back')
 
                 choice = self.ask_question('\nSelect option (1-3): ')
 
-                if choice == '1':
-                    start_index = end_index
-                    continue
-                elif choice == '2':
+                if choice == '2':
                     return threads
                 elif choice == '3':
-                    if all_threads and categories:
-                        return await self.select_threads_to_delete(categories, all_threads)
-                    return []
-                else:
-                    start_index = end_index
-                    continue
+                    return None
+                start_index = end_index
             else:
                 print('\n--- End of threads ---')
                 print('1. Delete all reviewed threads')
-                print('2. 🚪 Cancel and return to main menu')
+                print('2. 🚪 Cancel and go back')
 
                 choice = self.ask_question('\nSelect option (1-2): ')
 
-                if choice == '1':
-                    return threads
-                elif choice == '2':
-                    if all_threads and categories:
-                        return await self.select_threads_to_delete(categories, all_threads)
-                    return []
-                else:
-                    return threads
+                if choice == '2':
+                    return None
+                return threads
 
         return threads
 
-    async def confirm_delete_all(self, all_threads: List[Dict], categories: Dict) -> List[Dict]:
+    def confirm_delete_all(self, all_threads: List[Dict]) -> Optional[List[Dict]]:
         """Confirm deletion of all threads"""
         print(f'\n⚠️  WARNING: You are about to delete ALL {len(all_threads)} threads!')
         print('This action cannot be undone.')
@@ -432,40 +620,43 @@ class ThreadCleanup:
         initial_choice = self.ask_question('\nSelect option (1-2): ')
 
         if initial_choice != '1':
-            return await self.select_threads_to_delete(categories, all_threads)
+            return None
 
         confirm1 = self.ask_question('\nType "DELETE ALL" to confirm: ')
         if confirm1 != 'DELETE ALL':
             print('Confirmation failed. Returning to main menu.')
-            return await self.select_threads_to_delete(categories, all_threads)
+            return None
 
         confirm2 = self.ask_question(f'\nFinal confirmation: Delete all {len(all_threads)} threads? (yes/no): ')
         if confirm2.lower() != 'yes':
             print('Deletion cancelled. Returning to main menu.')
-            return await self.select_threads_to_delete(categories, all_threads)
+            return None
 
         return all_threads
 
-    async def select_by_status(self, by_status: Dict, all_threads: List[Dict], categories: Dict) -> Optional[List[Dict]]:
+    def select_by_status(self, by_status: Dict) -> Optional[List[Dict]]:
         """Select threads by status"""
-        print('\n📝 Select Status:')
-        statuses = list(by_status.keys())
-        for i, status in enumerate(statuses):
-            status_icons = {
-                'idle': '😴',
-                'running': '🏃',
-                'completed': '✅',
-                'failed': '❌',
-                'pending': '⏳'
-            }
-            icon = status_icons.get(status, '❓')
-            print(f'{i + 1}. {icon} {status} ({len(by_status[status])} threads)')
-        print(f'{len(statuses) + 1}. 🚪 Go back to main menu')
+        while True:
+            print('\n📝 Select Status:')
+            statuses = list(by_status.keys())
+            for i, status in enumerate(statuses):
+                icon = STATUS_ICONS.get(status, '❓')
+                print(f'{i + 1}. {icon} {status} ({len(by_status[status])} threads)')
+            print(f'{len(statuses) + 1}. 🚪 Go back to main menu')
+
+            choice = self.ask_question(f'Select status (1-{len(statuses) + 1}): ')
+            try:
+                index = int(choice) - 1
+            except ValueError:
+                index = -1
 
-        choice = self.ask_question(f'Select status (1-{len(statuses) + 1}): ')
-        index = int(choice) - 1
+            if index == len(statuses):
+                # Go back to main menu
+                return None
+            if not 0 <= index < len(statuses):
+                print('Invalid choice. Please try again.')
+                continue
 
-        if 0 <= index < len(statuses):
             selected_status = statuses[index]
             threads_to_delete = by_status[selected_status]
 
@@ -480,58 +671,48 @@ class ThreadCleanup:
             review_choice = self.ask_question('\nSelect option (1-3): ')
 
             if review_choice == '1':
-                return await self.review_threads(threads_to_delete, f'with status "{selected_status}"', all_threads, categories)
-            elif review_choice == '2':
-                return threads_to_delete
+                selection = self.review_threads(threads_to_delete, f'with status "{selected_status}"')
+                if selection is not None:
+                    return selection
+                continue
             elif review_choice == '3':
-                return await self.select_by_status(by_status, all_threads, categories)
+                continue
             else:
                 return threads_to_delete
-        elif index == len(statuses):
-            # Go back to main menu
-            return await self.select_threads_to_delete(categories, all_threads)
 
-        return []
-
-    async def select_by_runs(self, by_runs: Dict, all_threads: List[Dict], categories: Dict) -> Optional[List[Dict]]:
+    def select_by_runs(self, by_runs: Dict) -> Optional[List[Dict]]:
         """Select threads by runs count"""
-        print('\n🏃 Select by Runs Count:')
-
-        # Sort categories properly
-        runs_categories = list(by_runs.keys())
-        def get_runs_value(category):
-            if category == '0 runs':
-                return 0
-            elif category == '1 run':
-                return 1
-            elif '-' in category:
-                return int(category.split('-')[0])
-            elif category == '20+ runs':
-                return 20
-            else:
-                try:
-                    return int(category.split()[0])
-                except:
-                    return 0
-
-        runs_categories.sort(key=get_runs_value)
-
-        for i, category in enumerate(runs_categories):
-            if category == '0 runs':
-                icon = '🚫'
-            elif category == '1 run':
-                icon = '1️⃣'
-            elif '20+' in category:
-                icon = '🔥'
-            else:
-                icon = '🔢'
-            print(f'{i + 1}. {icon} {category} ({len(by_runs[category])} threads)')
-        print(f'{len(runs_categories) + 1}. 🚪 Go back to main menu')
+        while True:
+            print('\n🏃 Select by Runs Count:')
+
+            # Buckets already come sorted from categorization
+            runs_categories = list(by_runs.keys())
+
+            for i, category in enumerate(runs_categories):
+                if category == '0 runs':
+                    icon = '🚫'
+                elif category == '1 run':
+                    icon = '1️⃣'
+                elif '20+' in category:
+                    icon = '🔥'
+                else:
+                    icon = '🔢'
+                print(f'{i + 1}. {icon} {category} ({len(by_runs[category])} threads)')
+            print(f'{len(runs_categories) + 1}. 🚪 Go back to main menu')
 
-        choice = self.ask_question(f'Select runs category (1-{len(runs_categories) + 1}): ')
-        index = int(choice) - 1
+            choice = self.ask_question(f'Select runs category (1-{len(runs_categories) + 1}): ')
+            try:
+                index = int(choice) - 1
+            except ValueError:
+                index = -1
+
+            if index == len(runs_categories):
+                # Go back to main menu
+                return None
+            if not 0 <= index < len(runs_categories):
+                print('Invalid choice. Please try again.')
+                continue
 
-        if 0 <= index < len(runs_categories):
             selected_category = runs_categories[index]
             threads_to_delete = by_runs[selected_category]
 
@@ -546,31 +727,37 @@ class ThreadCleanup:
             review_choice = self.ask_question('\nSelect option (1-3): ')
 
             if review_choice == '1':
-                return await self.review_threads(threads_to_delete, f'with {selected_category}', all_threads, categories)
-            elif review_choice == '2':
-                return threads_to_delete
+                selection = self.review_threads(threads_to_delete, f'with {selected_category}')
+                if selection is not None:
+                    return selection
+                continue
             elif review_choice == '3':
-                return await self.select_by_runs(by_runs, all_threads, categories)
+                continue
             else:
                 return threads_to_delete
-        elif index == len(runs_categories):
-            # Go back to main menu
-            return await self.select_threads_to_delete(categories, all_threads)
 
-        return []
-
-    async def select_by_graph(self, by_graph: Dict, all_threads: List[Dict], categories: Dict) -> Optional[List[Dict]]:
+    def select_by_graph(self, by_graph: Dict) -> Optional[List[Dict]]:
         """Select threads by graph ID"""
-        print('\n🔧 Select by Graph ID:')
-        graphs = list(by_graph.keys())
-        for i, graph in enumerate(graphs):
-            print(f'{i + 1}. 📊 {graph} ({len(by_graph[graph])} threads)')
-        print(f'{len(graphs) + 1}. 🚪 Go back to main menu')
+        while True:
+            print('\n🔧 Select by Graph ID:')
+            graphs = list(by_graph.keys())
+            for i, graph in enumerate(graphs):
+                print(f'{i + 1}. 📊 {graph} ({len(by_graph[graph])} threads)')
+            print(f'{len(graphs) + 1}. 🚪 Go back to main menu')
+
+            choice = self.ask_question(f'Select graph (1-{len(graphs) + 1}): ')
+            try:
+                index = int(choice) - 1
+            except ValueError:
+                index = -1
 
-        choice = self.ask_question(f'Select graph (1-{len(graphs) + 1}): ')
-        index = int(choice) - 1
+            if index == len(graphs):
+                # Go back to main menu
+                return None
+            if not 0 <= index < len(graphs):
+                print('Invalid choice. Please try again.')
+                continue
 
-        if 0 <= index < len(graphs):
             selected_graph = graphs[index]
             threads_to_delete = by_graph[selected_graph]
 
@@ -585,20 +772,16 @@ class ThreadCleanup:
             review_choice = self.ask_question('\nSelect option (1-3): ')
 
             if review_choice == '1':
-                return await self.review_threads(threads_to_delete, f'for graph "{selected_graph}"', all_threads, categories)
-            elif review_choice == '2':
-                return threads_to_delete
+                selection = self.review_threads(threads_to_delete, f'for graph "{selected_graph}"')
+                if selection is not None:
+                    return selection
+                continue
             elif review_choice == '3':
-                return await self.select_by_graph(by_graph, all_threads, categories)
+                continue
             else:
                 return threads_to_delete
-        elif index == len(graphs):
-            # Go back to main menu
-            return await self.select_threads_to_delete(categories, all_threads)
 
-        return []
-
-    async def delete_threads(self, threads_to_delete: List[Dict]) -> int:
+    async def delete_threads(self, threads_to_delete: List[Dict], concurrency: int = 32) -> int:
         """Delete the selected threads"""
         if not threads_to_delete or len(threads_to_delete) == 0:
             return 0
@@ -610,47 +793,210 @@ class ThreadCleanup:
             print('Deletion cancelled.')
             return 0
 
+        # Deletes are independent and latency-bound, so issue them concurrently
+        # through a semaphore that keeps us from overwhelming the server
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(threads_to_delete)
+
+        async def delete_one(thread: Dict):
+            async with semaphore:
+                try:
+                    await self.client.threads.delete(thread['thread_id'])
+                    return (thread['thread_id'], None)
+                except Exception as delete_error:
+                    return (thread['thread_id'], delete_error)
+
         deleted = 0
         failed = 0
+        deleted_ids = set()
+        errors = []
+        last_update = 0.0
+
+        # Submit deletes in chunks so huge selections don't materialize one
+        # task object per thread up front; a single writer owns the live
+        # counter, throttled so the terminal isn't hammered per delete
+        chunk_size = 1000
+        for chunk_start in range(0, total, chunk_size):
+            chunk = threads_to_delete[chunk_start:chunk_start + chunk_size]
+            tasks = [asyncio.ensure_future(delete_one(thread)) for thread in chunk]
+            for future in asyncio.as_completed(tasks):
+                thread_id, error = await future
+                if error is None:
+                    deleted += 1
+                    deleted_ids.add(thread_id)
+                else:
+                    failed += 1
+                    errors.append((thread_id, error))
 
-        for thread in threads_to_delete:
-            try:
-                await self.client.threads.delete(thread['thread_id'])
-                deleted += 1
-                print(f"✅ Deleted: {deleted}/{len(threads_to_delete)}", end='\r')
-            except Exception as delete_error:
-                print(f"❌ Error deleting thread {thread['thread_id']}: {delete_error}")
-                failed += 1
-
-        print(f'\n\n📈 Summary: {deleted} deleted, {failed} failed')
+                now = time.monotonic()
+                if now - last_update > 0.05:
+                    sys.stdout.write(f'\r✅ Deleted: {deleted}/{total}')
+                    last_update = now
+
+        sys.stdout.write(f'\r✅ Deleted: {deleted}/{total}\n')
+        for thread_id, error in errors:
+            print(f'❌ Error deleting thread {thread_id}: {error}')
+
+        print(f'\n📈 Summary: {deleted} deleted, {failed} failed')
+        self._prune_deleted(deleted_ids)
         return deleted
 
+    def _prune_deleted(self, deleted_ids: set) -> None:
+        """Drop deleted threads from the cached categories in place"""
+        if not deleted_ids or self.categories is None:
+            return
+
+        for bucket_map in (self.categories['byGraph'], self.categories['byStatus'], self.categories['byRuns']):
+            for key in list(bucket_map):
+                kept = [thread for thread in bucket_map[key]
+                        if thread.get('thread_id') not in deleted_ids]
+                if kept:
+                    bucket_map[key] = kept
+                else:
+                    del bucket_map[key]
+
+        all_threads = self.categories['allThreads']
+        all_threads[:] = [thread for thread in all_threads
+                          if thread.get('thread_id') not in deleted_ids]
+
+        # Column arrays are no longer parallel to the pruned list
+        self._table = None
+
+    async def _discover_threads(self) -> List[Dict]:
+        """Fetch all matching threads with concurrent pagination"""
+        pages_acc = []
+        found = 0
+        limit = 1000
+        page_concurrency = self.concurrency
+        semaphore = asyncio.Semaphore(page_concurrency)
+
+        # Push any filters to the server so we only download candidates
+        search_kwargs = {}
+        if self.status:
+            search_kwargs['status'] = self.status
+            print(f'🔎 Filtering by status: {self.status}')
+        if self.graph_id:
+            search_kwargs['metadata'] = {'graph_id': self.graph_id}
+            print(f'🔎 Filtering by graph ID: {self.graph_id}')
+
+        async def fetch_page(offset: int) -> List[Dict]:
+            async with semaphore:
+                # Retry transient transport errors; anything else (bad auth,
+                # 4xx responses, cancellation) surfaces immediately
+                for attempt in range(3):
+                    try:
+                        return await self.client.threads.search(limit=limit, offset=offset, **search_kwargs)
+                    except _RETRYABLE_ERRORS:
+                        if attempt == 2:
+                            raise
+                        await asyncio.sleep(0.5 * (attempt + 1))
+
+        async def warm_pool() -> None:
+            # Open the sockets the fan-out will need up front, so the first
+            # wave doesn't pay a TCP/TLS handshake on every connection
+            async def ping() -> None:
+                try:
+                    await self.client.threads.search(limit=1, **search_kwargs)
+                except Exception:
+                    pass
+            await asyncio.gather(*(ping() for _ in range(page_concurrency)))
+
+        # Producer paginates; consumer annotates and categorizes finished
+        # pages, so that work overlaps the remaining fetches
+        page_queue = asyncio.Queue()
+        category_acc = {
+            'byGraph': defaultdict(list),
+            'byStatus': defaultdict(list),
+            'byRuns': defaultdict(list),
+        }
+        merge_lock = threading.Lock()
+
+        async def produce() -> None:
+            # The search API doesn't report a total count, so fetch the
+            # first page alone, then fan out offsets in concurrent waves
+            # (gather preserves offset order) until a page comes back short
+            nonlocal found
+            try:
+                await warm_pool()
+                page = await fetch_page(0)
+                if page:
+                    pages_acc.append(page)
+                    found += len(page)
+                    await page_queue.put(page)
+
+                offset = limit
+                while page and len(page) == limit:
+                    offsets = range(offset, offset + limit * page_concurrency, limit)
+                    pages = await asyncio.gather(*(fetch_page(off) for off in offsets))
+                    for page in pages:
+                        if page:
+                            pages_acc.append(page)
+                            found += len(page)
+                            await page_queue.put(page)
+                        if not page or len(page) < limit:
+                            break
+                    offset += limit * page_concurrency
+            finally:
+                await page_queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                page = await page_queue.get()
+                if page is None:
+                    break
+                await self._annotate_run_counts(page)
+                # Bucket the page in a worker thread; the event loop stays
+                # free to drive the sockets for the pages still in flight
+                await asyncio.to_thread(self._merge_page_categories, page, category_acc, merge_lock)
+
+        # A single background writer redraws the counter at a fixed rate,
+        # so the fetch path never touches stdout itself
+        stop_progress = asyncio.Event()
+
+        async def report_progress() -> None:
+            while not stop_progress.is_set():
+                print(f"Found: {found} threads", end='\r')
+                await asyncio.sleep(0.1)
+
+        progress_task = asyncio.create_task(report_progress())
+        try:
+            await asyncio.gather(produce(), consume())
+        finally:
+            stop_progress.set()
+            await progress_task
+            print(f"Found: {found} threads", end='\r')
+
+        # Flatten once instead of growing one list page by page
+        all_threads = list(chain.from_iterable(pages_acc))
+
+        # Categories were merged page by page while later fetches were
+        # still in flight; assemble the session result (sorted keys, same
+        # presentation as _build_categories) and seed the cache so
+        # interactive_clean doesn't redo the grouping
+        by_runs = category_acc['byRuns']
+        self._cats_cache = (all_threads, {
+            'byGraph': dict(sorted(category_acc['byGraph'].items())),
+            'byStatus': dict(sorted(category_acc['byStatus'].items())),
+            'byRuns': {label: by_runs[label] for label in RUNS_BUCKET_ORDER if label in by_runs},
+            'allThreads': all_threads,
+        })
+        return all_threads
+
     async def interactive_clean(self) -> None:
         """Main interactive cleanup function"""
         try:
             print('🔍 Discovering threads...')
             print(f'📡 Connecting to: {self.base_url}')
 
-            # Get all threads using SDK
-            all_threads = []
-            offset = 0
-            limit = 100
-
-            while True:
-                try:
-                    threads = await self.client.threads.search(limit=limit, offset=offset)
-                    if not threads or len(threads) == 0:
-                        break
-                    all_threads.extend(threads)
-                    offset += len(threads)
-                    print(f"Found: {len(all_threads)} threads", end='\r')
-                except Exception as search_error:
-                    print(f'\n❌ Error searching threads: {search_error}')
-                    print('Please check:')
-                    print('1. Your server URL is correct')
-                    print('2. Your API key has the right permissions')
-                    print('3. The server is running and accessible')
-                    raise
+            try:
+                all_threads = await self._discover_threads()
+            except Exception as search_error:
+                print(f'\n❌ Error searching threads: {search_error}')
+                print('Please check:')
+                print('1. Your server URL is correct')
+                print('2. Your API key has the right permissions')
+                print('3. The server is running and accessible')
+                raise
 
             if len(all_threads) == 0:
                 print('\n📋 No threads found.')
@@ -658,12 +1004,20 @@ class ThreadCleanup:
 
             print(f'\n✅ Found {len(all_threads)} threads')
 
-            # Categorize threads ONCE and cache it
-            categories = await self.categorize_threads(all_threads)
-            self.display_categories(categories)
+            # created_at was already parsed into _ts as each page streamed
+            # in; the time filters read it directly instead of re-parsing
+
+            # Columnar view for vectorized filtering and grouping; a NaN
+            # timestamp marks threads without a usable created_at and
+            # compares False against any range
+            self._table = ThreadTable.build(all_threads)
+
+            # Categorize threads ONCE and keep the result for the session
+            self.categories = await self._cats(all_threads)
+            self.display_categories(self.categories)
 
-            # Let user select what to delete (always pass fresh categories)
-            threads_to_delete = await self.select_threads_to_delete(categories, all_threads)
+            # Let user select what to delete
+            threads_to_delete = self.select_threads_to_delete(self.categories, all_threads)
 
             # Delete selected threads
             total_deleted = await self.delete_threads(threads_to_delete)
@@ -693,11 +1047,21 @@ Optional:
   --api-key, -k      LangSmith API key (required for custom server endpoints)
                      Example: --api-key lsv2_pt_your_key_here
 
+  --status, -s       Only consider threads with this status (filtered
+                     server-side, e.g. idle, busy, interrupted, error)
+
+  --graph-id, -g     Only consider threads for this graph ID (filtered
+                     server-side)
+
+  --concurrency, -c  Search pages to keep in flight during discovery
+                     (default: 8; raise for deployments with 100k+ threads)
+
   --help, -h         Show this help message
 
 Examples:
   python delete.py --url http://localhost:9123
   python delete.py --url https://my-server.com --api-key lsv2_pt_abc123
+  python delete.py --url http://localhost:9123 --status idle --graph-id agent
 """
     print(usage)
 
@@ -708,6 +1072,10 @@ def parse_args():
     parser.add_argument('--help', '-h', action='store_true', help='Show help message')
     parser.add_argument('--url', '-u', type=str, help='Base URL of your LangGraph server')
     parser.add_argument('--api-key', '-k', type=str, help='LangSmith API key')
+    parser.add_argument('--status', '-s', type=str, help='Only consider threads with this status')
+    parser.add_argument('--graph-id', '-g', type=str, help='Only consider threads for this graph ID')
+    parser.add_argument('--concurrency', '-c', type=int, default=8,
+                        help='Search pages to keep in flight during discovery')
 
     args = parser.parse_args()
 
@@ -733,11 +1101,7 @@ def validate_config(args):
         sys.exit(1)
 
     # Validate URL format
-    try:
-        result = urlparse(args.url)
-        if not result.scheme or not result.netloc:
-            raise ValueError("Invalid URL")
-    except Exception:
+    if not _URL_RE.match(args.url):
         print('❌ Error: Invalid BASE_URL format')
         print(f'Provided: {args.url}')
         print('Expected format: http://localhost:9123 or https://my-server.com')
@@ -755,11 +1119,14 @@ def validate_config(args):
 
 async def main():
     """Main function"""
+    cleanup = None
     try:
         args = parse_args()
         config = validate_config(args)
 
-        cleanup = ThreadCleanup(config.url, config.api_key)
+        cleanup = ThreadCleanup(config.url, config.api_key,
+                                status=config.status, graph_id=config.graph_id,
+                                concurrency=config.concurrency)
         await cleanup.interactive_clean()
 
     except KeyboardInterrupt:
@@ -768,7 +1135,18 @@ async def main():
     except Exception as error:
         print(f'❌ Unhandled error: {error}')
         sys.exit(1)
+    finally:
+        if cleanup is not None:
+            await cleanup.aclose()
 
 
 if __name__ == "__main__":
+    # uvloop is optional; it cuts per-request event-loop overhead during
+    # the pagination and delete storms
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
\ No newline at end of file